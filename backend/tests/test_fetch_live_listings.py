@@ -0,0 +1,167 @@
+import os
+import sys
+import time
+import unittest
+from email.utils import formatdate
+
+import requests
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'cards_binders'))
+
+from fetch_live_listings_simple import (
+    SimpleBrowserScraper,
+    _next_url_variant,
+    _parse_price,
+    _retry_after_seconds,
+)
+
+PRODUCT_URL = 'https://www.cardmarket.com/en/Magic/Products/Singles/Alpha/Ifh-Biff-Efreet?language=1'
+
+
+def legacy_row(condition_text, price='€ 12,50'):
+    html = ('<table><tr>'
+            '<td><a href="/en/Magic/Users/Bob">Bob</a></td>'
+            f'<td>{condition_text} English 3 x</td>'
+            f'<td><span title="Item location: Spain"></span>{price}</td>'
+            '</tr></table>')
+    return BeautifulSoup(html, 'html.parser').tr
+
+
+def modern_row(attributes, price='12,50 €', quantity='3'):
+    html = ('<div class="row article-row">'
+            '<div class="col-seller"><span title="Item location: Germany"></span>'
+            '<a href="/en/Magic/Users/Alice">Alice</a></div>'
+            f'<div class="product-attributes">{attributes}</div>'
+            f'<div class="price"><span class="color-primary">{price}</span>'
+            f'<span class="item-count">{quantity}</span></div>'
+            '</div>')
+    return BeautifulSoup(html, 'html.parser').div
+
+
+def response_with_headers(headers):
+    response = requests.Response()
+    response.status_code = 429
+    response.headers.update(headers)
+    return response
+
+
+class TestListingRowParsers(unittest.TestCase):
+
+    def setUp(self):
+        self.scraper = SimpleBrowserScraper(cookie_file=None, cache_ttl=None)
+
+    def test_legacy_row_fields(self):
+        listing = self.scraper._parse_listing_row(legacy_row('Near Mint'))
+        self.assertEqual(listing.price, 12.5)
+        self.assertEqual(listing.condition, 'NM')
+        self.assertEqual(listing.seller, 'Bob')
+        self.assertEqual(listing.seller_country, 'Spain')
+        self.assertEqual(listing.language, 'English')
+        self.assertEqual(listing.quantity, 3)
+        self.assertFalse(listing.foil)
+
+    def test_legacy_row_conditions(self):
+        cases = {
+            'Near Mint': 'NM',
+            'near mint': 'NM',
+            'Excellent': 'EX',
+            'EX': 'EX',
+            'Mint': 'MT',
+            'Light Played': 'LP',
+            'Good': 'GD',
+            'Expensive': 'Unknown',
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.scraper._parse_listing_row(legacy_row(text)).condition, expected)
+
+    def test_modern_row_fields(self):
+        row = modern_row('<span class="badge">EX</span>'
+                         '<span data-original-title="German">German</span><span>Foil</span>')
+        listing = self.scraper._parse_modern_listing_row(row)
+        self.assertEqual(listing.price, 12.5)
+        self.assertEqual(listing.condition, 'EX')
+        self.assertEqual(listing.seller, 'Alice')
+        self.assertEqual(listing.seller_country, 'Germany')
+        self.assertEqual(listing.language, 'German')
+        self.assertEqual(listing.quantity, 3)
+        self.assertTrue(listing.foil)
+
+    def test_modern_row_conditions(self):
+        cases = {'NM': 'NM', 'EX': 'EX', 'LP': 'LP', 'Expensive': 'Unknown'}
+        for badge, expected in cases.items():
+            with self.subTest(badge=badge):
+                row = modern_row(f'<span class="badge">{badge}</span>')
+                self.assertEqual(self.scraper._parse_modern_listing_row(row).condition, expected)
+
+    def test_modern_row_thousands_price(self):
+        row = modern_row('<span class="badge">NM</span>', price='1.234,56 €')
+        self.assertEqual(self.scraper._parse_modern_listing_row(row).price, 1234.56)
+
+
+class TestParsePrice(unittest.TestCase):
+
+    def test_simple_price(self):
+        self.assertEqual(_parse_price('12,50 €'), 12.5)
+        self.assertEqual(_parse_price('0,99€'), 0.99)
+
+    def test_thousands_price(self):
+        self.assertEqual(_parse_price('1.234,56 €'), 1234.56)
+
+    def test_highest_thousands_price_wins(self):
+        self.assertEqual(_parse_price('1.234,56 € or 2.000,00 €'), 2000.0)
+
+    def test_no_price(self):
+        self.assertIsNone(_parse_price('no price here'))
+
+
+class TestNextUrlVariant(unittest.TestCase):
+
+    def test_first_retry_appends_version(self):
+        self.assertEqual(
+            _next_url_variant(PRODUCT_URL, 0),
+            'https://www.cardmarket.com/en/Magic/Products/Singles/Alpha/Ifh-Biff-Efreet-V-1?language=1')
+
+    def test_second_retry_collapses_hyphens(self):
+        versioned = _next_url_variant(PRODUCT_URL, 0)
+        self.assertEqual(
+            _next_url_variant(versioned, 1),
+            'https://www.cardmarket.com/en/Magic/Products/Singles/Alpha/IfhBiff-Efreet?language=1')
+
+    def test_strategies_exhausted(self):
+        self.assertIsNone(_next_url_variant(PRODUCT_URL, 2))
+        self.assertIsNone(_next_url_variant('https://www.cardmarket.com/en/Magic/Products/Singles/Alpha/Bolt', 1))
+
+
+class TestRetryAfterSeconds(unittest.TestCase):
+
+    def test_delta_seconds(self):
+        self.assertEqual(_retry_after_seconds(response_with_headers({'Retry-After': '30'})), 30.0)
+
+    def test_http_date(self):
+        retry_after = formatdate(time.time() + 120, usegmt=True)
+        wait = _retry_after_seconds(response_with_headers({'Retry-After': retry_after}))
+        self.assertAlmostEqual(wait, 120, delta=2)
+
+    def test_http_date_in_the_past(self):
+        retry_after = formatdate(time.time() - 120, usegmt=True)
+        self.assertEqual(_retry_after_seconds(response_with_headers({'Retry-After': retry_after})), 0.0)
+
+    def test_invalid_value(self):
+        self.assertIsNone(_retry_after_seconds(response_with_headers({'Retry-After': 'soon'})))
+
+    def test_rate_limit_reset(self):
+        headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '15'}
+        self.assertEqual(_retry_after_seconds(response_with_headers(headers)), 15.0)
+
+    def test_rate_limit_not_exhausted(self):
+        headers = {'X-RateLimit-Remaining': '3', 'X-RateLimit-Reset': '15'}
+        self.assertIsNone(_retry_after_seconds(response_with_headers(headers)))
+
+    def test_no_headers(self):
+        self.assertIsNone(_retry_after_seconds(response_with_headers({})))
+
+
+if __name__ == '__main__':
+    unittest.main()
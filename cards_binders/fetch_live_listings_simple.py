@@ -7,15 +7,270 @@ look exactly like a real browser, without the complexity of proxies.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import time
 import json
 import sys
 import random
-from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+import math
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
+from collections import OrderedDict
+from operator import attrgetter, itemgetter
+from urllib.parse import urlsplit, urlunsplit
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import queue
+import atexit
+import hashlib
+import io
+import shutil
+import os
 import re
 
+# lxml's C tree builder is several times faster than html.parser; keep the
+# scraper usable on installs without it
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# orjson serializes several times faster than the stdlib; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Browser identities to rotate between scraper sessions. Each keeps the
+# User-Agent and its Chromium client hints consistent with each other.
+_BROWSER_PROFILES = tuple(MappingProxyType(p) for p in (
+    {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+        'sec-ch-ua-platform': '"macOS"',
+    },
+    {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+        'sec-ch-ua-platform': '"Windows"',
+    },
+    {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+        'sec-ch-ua': '"Google Chrome";v="119", "Chromium";v="119", "Not?A_Brand";v="24"',
+        'sec-ch-ua-platform': '"macOS"',
+    },
+    {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+        'sec-ch-ua': '"Google Chrome";v="119", "Chromium";v="119", "Not?A_Brand";v="24"',
+        'sec-ch-ua-platform': '"Windows"',
+    },
+    {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
+        'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Microsoft Edge";v="120"',
+        'sec-ch-ua-platform': '"Windows"',
+    },
+))
+
+# Headers shared by every profile (copied from real Chrome)
+_BASE_HEADERS = MappingProxyType({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'sec-ch-ua-mobile': '?0',
+    'Cache-Control': 'max-age=0'
+})
+
+# Listing parser patterns, compiled once at import rather than per row/page
+# Multi-thousand European format: 1.234,56 (also covers "€1.234,56" and "1.234,56 €")
+_THOUSANDS_PRICE_RE = re.compile(r'\d{1,3}(?:\.\d{3})+,\d{2}')
+_SIMPLE_PRICE_RE = re.compile(r'(\d+[.,]\d+)\s*€')  # 12,34 € / 12.34 €
+_EURO_PREFIX_PRICE_RE = re.compile(r'€\s*(\d+[.,]\d+)')  # €12,34 / €12.34
+# Legacy table fallback: €234,56 / €234.56 / 234,56 € / 234.56 €
+_PRICE_ANY_RE = re.compile(r'€\s*(\d+[.,]\d{2})|(\d+[.,]\d{2})\s*€')
+_QTY_RE = re.compile(r'(\d+)\s*x', re.I)
+_USER_RE = re.compile(r'user', re.I)
+# Legacy condition words → Cardmarket codes. The two-word phrases are checked
+# first so "near mint" wins over "mint" and "light played" over "played"
+_CONDITION_PHRASES = (('near mint', 'NM'), ('light played', 'LP'))
+_CONDITION_TOKENS = MappingProxyType({
+    'excellent': 'EX', 'played': 'PL', 'mint': 'MT', 'good': 'GD', 'poor': 'PO',
+    'nm': 'NM', 'mt': 'MT', 'ex': 'EX', 'gd': 'GD', 'lp': 'LP', 'pl': 'PL', 'po': 'PO',
+})
+_TOKEN_PUNCTUATION = '()[]{}.,:;|/-'
+_ITEM_LOCATION_PREFIX = 'Item location'  # Usually followed by ': Country'
+_CONDITIONS = frozenset({'MT', 'NM', 'EX', 'GD', 'LP', 'PL', 'PO'})
+# Case-insensitive patterns rather than lowercased copies of every row
+_LANGUAGES = tuple((re.compile(key, re.I), name) for key, name in (
+    ('english', 'English'), ('german', 'German'), ('french', 'French')
+))
+_FOIL_RE = re.compile(r'foil', re.I)
+_AVAILABLE_ITEMS_LABEL_RE = re.compile(r'available.*items|items.*available', re.I | re.S)
+_BREADCRUMB_CLASS_RE = re.compile(r'breadcrumb|nav', re.I)
+_EXPANSION_PROPERTY_RE = re.compile(r'expansion', re.I)
+# Price string → float() input in a single pass: "12,34" → "12.34", "1.234,56" → "1234.56"
+_COMMA_DOT = str.maketrans(',', '.')
+_EUROPEAN_DECIMAL = str.maketrans({'.': None, ',': '.'})
+_output = threading.local()  # .buffer: per-page StringIO while a fetch_many worker runs
+_DEBUG_QUEUE_SIZE = 32  # Pending debug writes; further dumps are dropped until the writer catches up
+_MEMORY_CACHE_SIZE = 1024  # Parsed results kept in memory in front of the disk cache
+_ILLEGAL_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
+
+def _is_item_location(title: Optional[str]) -> bool:
+    """Title filter for the seller's "Item location: Country" icon span."""
+    return title is not None and _ITEM_LOCATION_PREFIX in title
+
+
+def _seller_country(row) -> str:
+    """Country from the row's "Item location: Country" span, or "Unknown"."""
+    location_span = row.find('span', title=_is_item_location)
+    if location_span is None:
+        return "Unknown"
+    title = location_span['title']
+    # One find + slice instead of replace() over the whole title; the colon is optional
+    return title[title.find(_ITEM_LOCATION_PREFIX) + len(_ITEM_LOCATION_PREFIX):].lstrip(':').strip()
+
+
+def _log(*args, **kwargs):
+    """
+    print() for scraper progress messages.
+    
+    Inside a fetch_many worker the lines go to that worker's per-page buffer
+    instead, so concurrent pages don't interleave on the console.
+    """
+    print(*args, file=getattr(_output, 'buffer', None) or sys.stdout, **kwargs)
+
+
+def _parse_price(text: str) -> Optional[float]:
+    """
+    Parse a Cardmarket price from text, handling European number format (1.234,56).
+    
+    Multi-thousand values win (the highest one if several are present);
+    otherwise the first simple "12,34 €" style price is used.
+    
+    Returns:
+        The price, or None if the text contains no price
+    """
+    european_matches = _THOUSANDS_PRICE_RE.findall(text)
+    if european_matches:
+        return max(float(m.translate(_EUROPEAN_DECIMAL)) for m in european_matches)
+    
+    price_match = _SIMPLE_PRICE_RE.search(text)
+    if price_match:
+        return float(price_match.group(1).translate(_COMMA_DOT))
+    return None
+
+
+def _dumps_json(data, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON, with orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+
+def _loads_json(data: bytes):
+    """Parse JSON bytes, with orjson when it is installed."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _next_url_variant(url: str, retry_count: int) -> Optional[str]:
+    """
+    Next product URL to try when Cardmarket shows a multi-version list.
+    
+    The first retry appends -V-1 to the card slug. The second collapses
+    internal hyphens (e.g. "Ifh-Biff-Efreet" → "IfhBiff-Efreet"), which
+    handles names CardMarket treats as compound words.
+    
+    Returns:
+        The URL to try next, or None once the strategies are exhausted
+    """
+    card_name_slug = _url_slug(url)
+    if retry_count == 0:
+        if not card_name_slug.endswith('-V-1'):
+            return _replace_url_slug(url, f"{card_name_slug}-V-1")
+    elif retry_count == 1:
+        if card_name_slug.count('-') >= 2:
+            # Remove -V-1 if present, then collapse all but the last hyphen
+            slug_parts = card_name_slug.replace('-V-1', '').split('-')
+            if len(slug_parts) >= 2:
+                collapsed = ''.join(slug_parts[:-1]) + '-' + slug_parts[-1]
+                return _replace_url_slug(url, collapsed)
+    return None
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """
+    Cooldown requested by the server, in seconds.
+    
+    Reads Retry-After (delta-seconds or HTTP date), falling back to
+    X-RateLimit-Reset (delta or epoch seconds) once X-RateLimit-Remaining
+    hits zero.
+    
+    Returns:
+        Seconds to wait, or None if the response does not say
+    """
+    retry_after = response.headers.get('Retry-After', '').strip()
+    if retry_after:
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+    
+    reset = response.headers.get('X-RateLimit-Reset', '').strip()
+    if reset and response.headers.get('X-RateLimit-Remaining', '').strip() == '0':
+        try:
+            reset_value = float(reset)
+        except ValueError:
+            return None
+        # Large values are an epoch timestamp, small ones a delta
+        return max(0.0, reset_value - time.time()) if reset_value > 1e9 else reset_value
+    
+    return None
+
+
+def _url_slug(url: str) -> str:
+    """Last path segment of a URL (the card name slug on product pages)."""
+    return urlsplit(url).path.rsplit('/', 1)[-1]
+
+
+def _expansion_slug(url: str) -> Optional[str]:
+    """Expansion path segment of a /Singles/{Expansion}/{CardName} URL, or None."""
+    path = urlsplit(url).path
+    if '/Singles/' not in path:
+        return None
+    return path.split('/Singles/', 1)[1].split('/')[0]
+
+
+def _replace_url_slug(url: str, new_slug: str) -> str:
+    """Return url with its last path segment replaced, keeping query and fragment."""
+    parsed = urlsplit(url)
+    base_path = parsed.path.rsplit('/', 1)[0]
+    return urlunsplit(parsed._replace(path=f"{base_path}/{new_slug}"))
+
+
+@lru_cache(maxsize=4096)
+def _image_filepath(card_name: str, ext: str, image_dir: str) -> str:
+    """Build the image path for a card: illegal chars removed, spaces to underscores."""
+    card_name = _ILLEGAL_FILENAME_CHARS_RE.sub('', card_name)
+    card_name = card_name.replace(' ', '_').replace(',', '').replace("'", "")
+    return os.path.join(image_dir, f"{card_name}.{ext}")
+
 
 @dataclass
 class FetchResult:
@@ -25,7 +280,7 @@ class FetchResult:
     expansion_name: Optional[str] = None  # Expansion/set name extracted from page
 
 
-@dataclass
+@dataclass(slots=True)
 class LiveListing:
     """Represents a live listing from Cardmarket."""
     price: float
@@ -35,12 +290,27 @@ class LiveListing:
     language: str = "Unknown"
     quantity: int = 1
     foil: bool = False
+    
+    def as_dict(self) -> Dict[str, object]:
+        """Flat dict of the fields (dataclasses.asdict without the recursive copy)."""
+        return {
+            'price': self.price,
+            'condition': self.condition,
+            'seller': self.seller,
+            'seller_country': self.seller_country,
+            'language': self.language,
+            'quantity': self.quantity,
+            'foil': self.foil,
+        }
 
 
 class SimpleBrowserScraper:
     """Simple scraper that just mimics a real browser perfectly."""
     
-    def __init__(self, delay_range: tuple = (3.0, 5.0), max_retries: int = 1, save_images: bool = False, image_dir: str = "card_images"):
+    def __init__(self, delay_range: tuple = (3.0, 5.0), max_retries: int = 1, save_images: bool = False, image_dir: str = "card_images",
+                 max_concurrent_requests: int = 12, cookie_file: Optional[str] = "data/.cardmarket_cookies.json",
+                 cache_dir: str = "data/.listings_cache", cache_ttl: Optional[float] = 3600,
+                 max_requests_per_host: int = 6):
         """
         Initialize the simple browser scraper.
         
@@ -49,6 +319,11 @@ class SimpleBrowserScraper:
             max_retries: Maximum number of retry attempts for failed requests
             save_images: Whether to save card images
             image_dir: Directory to save card images
+            max_concurrent_requests: Maximum number of HTTP requests in flight at once (keeps fetch_many under Cardmarket's rate limit)
+            cookie_file: JSON file where persistent cookies are kept between runs (None to disable)
+            cache_dir: Directory for cached parsed listings
+            cache_ttl: Seconds a cached page result stays valid (None or 0 to disable caching)
+            max_requests_per_host: Maximum number of HTTP requests in flight to the same host, so product pages can't take every slot from image downloads (request pacing is set by delay_range)
         """
         self.delay_range = delay_range
         self.max_retries = max_retries
@@ -56,17 +331,46 @@ class SimpleBrowserScraper:
         self.image_dir = image_dir
         self.session = requests.Session()
         self.rate_limited = False  # Track if we've been rate limited
+        self.max_concurrent_requests = max_concurrent_requests
+        self._request_slots = threading.BoundedSemaphore(max_concurrent_requests)
+        self.max_requests_per_host = max_requests_per_host
+        self._host_slots = {}  # netloc -> BoundedSemaphore(max_requests_per_host)
+        self._host_slots_lock = threading.Lock()
+        self._output_lock = threading.Lock()  # Keeps each fetch_many page's output together
+        self.cookie_file = cookie_file
+        self._warmed_up = False  # Landing page visited this process (fresh session cookies set)
+        self._warmup_lock = threading.Lock()
+        # Request pacing shared by all fetch_many workers: start time of the last page
+        # request, and the earliest time.time() the server allows another one
+        self._pacing_lock = threading.Lock()
+        self._last_request_at = 0.0
+        self._next_allowed_at = 0.0
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self._memory_cache = OrderedDict()  # (url, max_listings) -> (stored_at, FetchResult, card image), LRU order
+        self._memory_cache_lock = threading.Lock()
+        self._known_images = set()  # Image paths already confirmed on disk
+        # (filepath, content, mode) for the debug writer thread; bounded so a slow disk can't pile up page HTML
+        self._debug_queue = queue.Queue(maxsize=_DEBUG_QUEUE_SIZE)
+        self._debug_writer = None
+        self._debug_writer_lock = threading.Lock()
+        self._summary_fh = None  # debug_summary.log, held open by the writer thread
         
         # Create image directory if needed
         if self.save_images:
-            import os
             os.makedirs(self.image_dir, exist_ok=True)
         
         # Set up session to look exactly like Chrome
         self._setup_realistic_session()
+        
+        # Restore long-lived cookies (consent, preferences) from a previous run. They only
+        # supplement the session: the landing page is still visited once per process.
+        if self.cookie_file:
+            self._load_cookies()
+            atexit.register(self._save_cookies)
     
     def _setup_realistic_session(self):
-        """Set up the session to look exactly like a real Chrome browser."""
+        """Set up the session to look exactly like a real Chromium-based browser."""
         
         # Check if brotli is available for decompression
         try:
@@ -74,30 +378,113 @@ class SimpleBrowserScraper:
             accept_encoding = 'gzip, deflate, br'  # Include brotli if available
         except ImportError:
             accept_encoding = 'gzip, deflate'  # Skip brotli if not available
-            print("   💡 Brotli compression not available - install with: pip install brotli")
-        
-        # Perfect Chrome headers (copied from real browser)
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': accept_encoding,
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"macOS"',
-            'Cache-Control': 'max-age=0'
-        })
+            _log("   💡 Brotli compression not available - install with: pip install brotli")
+        
+        # Realistic browser headers, with a browser identity picked per session.
+        # The identity stays fixed for the session: switching User-Agent
+        # mid-session under the same cookies is itself a bot signal.
+        self.session.headers.update(_BASE_HEADERS)
+        self.session.headers.update(random.choice(_BROWSER_PROFILES))
+        self.session.headers['Accept-Encoding'] = accept_encoding
+        
+        # Keep one pooled keep-alive connection per request that can be in
+        # flight to a host, so repeat requests to www.cardmarket.com skip the
+        # TCP + TLS handshake. Pools are per host, so their size follows the
+        # per-host limit rather than the overall one. pool_block caps sockets
+        # per host at that size: a request waits for a pooled connection
+        # rather than handshaking a throwaway extra one. (requests is HTTP/1.1
+        # only, so this pool is how handshakes are amortized instead of
+        # HTTP/2 multiplexing.)
+        pool_size = min(self.max_concurrent_requests, self.max_requests_per_host)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # Set a realistic timeout
         self.session.timeout = 30
     
+    def _load_cookies(self):
+        """Restore persistent cookies saved by a previous run."""
+        try:
+            with open(self.cookie_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            for cookie in saved:
+                self.session.cookies.set(
+                    cookie['name'], cookie['value'],
+                    domain=cookie['domain'], path=cookie['path'],
+                    expires=cookie['expires'], secure=cookie['secure'], discard=False
+                )
+            self.session.cookies.clear_expired_cookies()
+            # Saved cookies can't tell us whether the server-side session is still
+            # alive, so they never let us skip the warm-up
+            self.session.cookies.clear_session_cookies()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            _log(f"⚠️  Could not load saved cookies: {e}")
+    
+    def _save_cookies(self):
+        """Persist cookies that have an expiry so the next run starts with them."""
+        try:
+            os.makedirs(os.path.dirname(self.cookie_file) or '.', exist_ok=True)
+            saved = [
+                {
+                    'name': c.name, 'value': c.value, 'domain': c.domain,
+                    'path': c.path, 'expires': c.expires, 'secure': c.secure
+                }
+                for c in self.session.cookies
+                if c.expires is not None
+            ]
+            with open(self.cookie_file, 'w', encoding='utf-8') as f:
+                json.dump(saved, f)
+        except Exception as e:
+            _log(f"⚠️  Could not save cookies: {e}")
+    
+    def _warm_up(self):
+        """Visit the Magic landing page once per session to pick up cookies."""
+        with self._warmup_lock:
+            if not self._warmed_up:
+                self._get('https://www.cardmarket.com/en/Magic', timeout=15)
+                self._warmed_up = True
+    
+    def _reserve_request_time(self, delay: float) -> float:
+        """
+        Reserve the start time of the next page request.
+        
+        Requests start at least `delay` seconds after the previously reserved
+        one and never before a server-requested cooldown ends, however many
+        fetch_many workers are asking. The slot is claimed under the lock, so
+        concurrent callers queue up one after another instead of all sleeping
+        the same delay and firing together.
+        
+        Returns:
+            Seconds to sleep before starting the request
+        """
+        with self._pacing_lock:
+            now = time.time()
+            start = max(now, self._last_request_at + delay, self._next_allowed_at)
+            self._last_request_at = start
+            return start - now
+    
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Per-host request limiter, created on first use."""
+        host = urlsplit(url).netloc
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.max_requests_per_host)
+            return slot
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Issue a GET on the shared session, waiting for a free request slot first.
+        
+        Requests to the same host are limited to max_requests_per_host at a
+        time; requests to different hosts (pages vs. card images) overlap.
+        """
+        with self._host_slot(url), self._request_slots:
+            return self.session.get(url, **kwargs)
+    
     def _decompress_response(self, response: requests.Response) -> Optional[str]:
         """
         Manually decompress response content if automatic decompression failed.
@@ -115,22 +502,22 @@ class SimpleBrowserScraper:
             if 'gzip' in content_encoding:
                 import gzip
                 html_content = gzip.decompress(content).decode('utf-8', errors='replace')
-                print(f"   ✅ Successfully decompressed gzip content")
+                _log(f"   ✅ Successfully decompressed gzip content")
                 return html_content
             elif 'deflate' in content_encoding:
                 import zlib
                 html_content = zlib.decompress(content).decode('utf-8', errors='replace')
-                print(f"   ✅ Successfully decompressed deflate content")
+                _log(f"   ✅ Successfully decompressed deflate content")
                 return html_content
             elif 'br' in content_encoding or 'brotli' in content_encoding:
                 try:
                     import brotli
                     html_content = brotli.decompress(content).decode('utf-8', errors='replace')
-                    print(f"   ✅ Successfully decompressed brotli content")
+                    _log(f"   ✅ Successfully decompressed brotli content")
                     return html_content
                 except ImportError:
-                    print(f"   ⚠️  Brotli compression detected but brotli library not installed")
-                    print(f"      Install with: pip install brotli")
+                    _log(f"   ⚠️  Brotli compression detected but brotli library not installed")
+                    _log(f"      Install with: pip install brotli")
                     return None
             else:
                 # Try to decode as UTF-8 directly
@@ -141,7 +528,7 @@ class SimpleBrowserScraper:
                     return None
                     
         except Exception as e:
-            print(f"   ❌ Manual decompression failed: {e}")
+            _log(f"   ❌ Manual decompression failed: {e}")
             return None
     
     def _make_realistic_request(self, url: str, retry_attempt: int = 0) -> Optional[requests.Response]:
@@ -157,32 +544,39 @@ class SimpleBrowserScraper:
         else:
             delay = random.uniform(*self.delay_range)
         
-        time.sleep(delay)
+        # Space requests globally, not per worker, and never go before a
+        # server-requested cooldown ends (the cooldown replaces the normal
+        # delay rather than adding to it)
+        time.sleep(self._reserve_request_time(delay))
         
         try:
-            # First, let's visit the main site to get cookies/session
-            main_response = self.session.get('https://www.cardmarket.com/en/Magic', timeout=15)
-            
-            # Small delay
-            time.sleep(random.uniform(1.0, 2.0))
+            # Visit the main site first (once per session) to get cookies
+            if not self._warmed_up:
+                self._warm_up()
             
             # Now make the actual request
-            response = self.session.get(url, timeout=15)
+            response = self._get(url, timeout=15)
             
             if response.status_code == 200:
                 return response
             else:
                 # Retry on certain status codes with exponential backoff
                 if response.status_code in [429, 503, 504] and retry_attempt < self.max_retries:
+                    # Prefer the cooldown the server asks for over our own guess
+                    wait_time = _retry_after_seconds(response)
                     if response.status_code == 429:
                         self.rate_limited = True
-                        # Exponential backoff: 30s, 60s, 120s
-                        wait_time = 30 * (2 ** retry_attempt)
-                        print(f"⚠️  Rate limited (attempt {retry_attempt + 1}/{self.max_retries + 1}), waiting {wait_time}s...")
+                        if wait_time is None:
+                            # Exponential backoff: 30s, 60s, 120s
+                            wait_time = 30 * (2 ** retry_attempt)
+                        _log(f"⚠️  Rate limited (attempt {retry_attempt + 1}/{self.max_retries + 1}), waiting {wait_time:.0f}s...")
                     else:
-                        wait_time = 10 * (2 ** retry_attempt)
-                        print(f"⚠️  Server error {response.status_code} (attempt {retry_attempt + 1}/{self.max_retries + 1}), waiting {wait_time}s...")
-                    time.sleep(wait_time)
+                        if wait_time is None:
+                            wait_time = 10 * (2 ** retry_attempt)
+                        _log(f"⚠️  Server error {response.status_code} (attempt {retry_attempt + 1}/{self.max_retries + 1}), waiting {wait_time:.0f}s...")
+                    # The retry (and any other worker) waits out the cooldown in its pre-request delay
+                    with self._pacing_lock:
+                        self._next_allowed_at = max(self._next_allowed_at, time.time() + wait_time)
                     return self._make_realistic_request(url, retry_attempt + 1)
                 
                 # If we exhausted retries due to rate limiting, stop the script
@@ -204,50 +598,90 @@ class SimpleBrowserScraper:
                 return self._make_realistic_request(url, retry_attempt + 1)
             return None
     
-    def fetch_listings(self, url: str, max_listings: int = 20, retry_count: int = 0) -> FetchResult:
+    def fetch_listings(self, url: str, max_listings: int = 20) -> FetchResult:
         """
         Fetch live listings from a Cardmarket product page.
         
+        If the URL lands on a multi-version list, alternative product URLs
+        are tried (see _next_url_variant) before giving up.
+        
         Args:
             url: The Cardmarket product URL
             max_listings: Maximum number of listings to fetch
-            retry_count: Internal retry counter
             
         Returns:
             FetchResult with listings and available_items_total (liquidity indicator)
         """
+        cached = self._load_cached_result(url, max_listings)
+        if cached:
+            result, card_image = cached
+            _log(f"   💾 Using cached listings ({len(result.listings)} found)")
+            # The page isn't parsed on a hit, so save the image from the URL cached with it
+            if self.save_images and card_image:
+                self._save_card_image(*card_image)
+            return result
+        
+        page_url = url
+        retry_count = 0
+        while True:
+            result, card_image, next_url = self._fetch_listings_page(page_url, max_listings, retry_count)
+            if not next_url:
+                break
+            page_url = next_url
+            retry_count += 1
+        
+        # Cache under the requested URL so the next lookup skips the version retries too
+        if result.listings:
+            self._store_cached_result(url, max_listings, result, card_image)
+        return result
+    
+    def _fetch_listings_page(self, url: str, max_listings: int,
+                             retry_count: int) -> Tuple[FetchResult, Optional[Tuple[str, str]], Optional[str]]:
+        """
+        Fetch and parse a single Cardmarket product page.
+        
+        Args:
+            url: The Cardmarket product URL
+            max_listings: Maximum number of listings to fetch
+            retry_count: How many URL variants have been tried already
+            
+        Returns:
+            (FetchResult, (image URL, card name) or None, next URL variant to try or None)
+        """
         response = self._make_realistic_request(url)
         
         if not response:
-            print("   ❌ Could not fetch live prices - request failed (check network/rate limiting)")
-            print("      This usually means:")
-            print("      - Network connectivity issue")
-            print("      - Rate limiting from Cardmarket")
-            print("      - Server timeout")
+            _log("   ❌ Could not fetch live prices - request failed (check network/rate limiting)")
+            _log("      This usually means:")
+            _log("      - Network connectivity issue")
+            _log("      - Rate limiting from Cardmarket")
+            _log("      - Server timeout")
             # Try to extract expansion from URL as fallback
             expansion_name = None
-            if '/Singles/' in url:
-                try:
-                    parts = url.split('/Singles/')
-                    if len(parts) > 1:
-                        path_part = parts[1].split('?')[0]
-                        if '/' in path_part and not path_part.split('/')[0].isdigit():
-                            expansion_slug = path_part.split('/')[0]
-                            expansion_name = expansion_slug.replace('-', ' ').title()
-                except Exception:
-                    pass
-            return FetchResult(listings=[], available_items_total=None, expansion_name=expansion_name)
+            url_path = urlsplit(url).path
+            if '/Singles/' in url_path:
+                path_part = url_path.split('/Singles/', 1)[1]
+                expansion_slug, sep, _ = path_part.partition('/')
+                if sep and not expansion_slug.isdigit():
+                    expansion_name = expansion_slug.replace('-', ' ').title()
+            return FetchResult(listings=[], available_items_total=None, expansion_name=expansion_name), None, None
         
         # Log response status
         if response.status_code != 200:
-            print(f"   ⚠️  Received HTTP {response.status_code} response")
+            _log(f"   ⚠️  Received HTTP {response.status_code} response")
         
         # Decode the response properly (requests handles decompression automatically)
         try:
             # Check content encoding
             content_encoding = response.headers.get('content-encoding', '').lower()
             if content_encoding:
-                print(f"   📦 Response encoding: {content_encoding}")
+                _log(f"   📦 Response encoding: {content_encoding}")
+            
+            # Cardmarket serves UTF-8. Without a declared charset requests would
+            # either run charset detection over the whole body or assume
+            # ISO-8859-1 (mangling €), so pin the encoding before decoding
+            if 'charset' not in response.headers.get('content-type', '').lower():
+                response.encoding = 'utf-8'
             
             # Use response.text which automatically handles decompression
             # But first check if response.raw was used (which might bypass decompression)
@@ -256,34 +690,34 @@ class SimpleBrowserScraper:
             # Verify we got valid HTML (check for common HTML tags or cardmarket text)
             # Don't use isprintable() as it's too strict - HTML can have non-printable chars
             if len(html_content) < 100:
-                print(f"   ⚠️  Response too short ({len(html_content)} chars), may be compressed")
+                _log(f"   ⚠️  Response too short ({len(html_content)} chars), may be compressed")
                 html_content = self._decompress_response(response)
                 if not html_content:
-                    return FetchResult(listings=[], available_items_total=None, expansion_name=None)
-            elif not ('<' in html_content[:500] or 'cardmarket' in html_content.lower()[:1000] or 'html' in html_content.lower()[:500]):
+                    return FetchResult(listings=[], available_items_total=None, expansion_name=None), None, None
+            elif not ('<' in html_content[:500] or 'cardmarket' in html_content[:1000].lower() or 'html' in html_content[:500].lower()):
                 # Content doesn't look like HTML - try manual decompression
-                print(f"   ⚠️  Response doesn't appear to be HTML, attempting manual decompression...")
+                _log(f"   ⚠️  Response doesn't appear to be HTML, attempting manual decompression...")
                 html_content = self._decompress_response(response)
                 if not html_content:
                     # Save raw content for debugging
                     raw_preview = response.content[:2000].decode('utf-8', errors='replace')
                     self._save_debug_html(raw_preview, url, "decompression_failed_binary")
-                    print(f"   ❌ Could not decompress response (saved first 2000 bytes for debugging)")
-                    return FetchResult(listings=[], available_items_total=None, expansion_name=None)
+                    _log(f"   ❌ Could not decompress response (saved first 2000 bytes for debugging)")
+                    return FetchResult(listings=[], available_items_total=None, expansion_name=None), None, None
             
             # Save successful HTML
             self._save_debug_html(html_content, url, "success")
                     
         except UnicodeDecodeError as e:
             # Try manual decompression
-            print(f"   ⚠️  Unicode decode error, attempting manual decompression...")
+            _log(f"   ⚠️  Unicode decode error, attempting manual decompression...")
             html_content = self._decompress_response(response)
             if not html_content:
                 self._save_debug_info(url, "decode_failed", f"Unicode decode error: {e}", response)
-                return FetchResult(listings=[], available_items_total=None, expansion_name=None)
+                return FetchResult(listings=[], available_items_total=None, expansion_name=None), None, None
         except Exception as e:
             # Try manual decompression as fallback
-            print(f"   ⚠️  Error reading response: {e}, attempting manual decompression...")
+            _log(f"   ⚠️  Error reading response: {e}, attempting manual decompression...")
             html_content = self._decompress_response(response)
             if not html_content:
                 try:
@@ -292,64 +726,56 @@ class SimpleBrowserScraper:
                     self._save_debug_html(html_content[:5000], url, "fallback_decode", str(e))
                 except Exception as decode_error:
                     self._save_debug_info(url, "decode_failed", f"Decompression error: {e}, Decode error: {decode_error}", response)
-                    return FetchResult(listings=[], available_items_total=None, expansion_name=None)
+                    return FetchResult(listings=[], available_items_total=None, expansion_name=None), None, None
+        
+        # Lowercase the page once for all keyword checks below
+        html_lower = html_content.lower()
+        has_article_rows = 'article-row' in html_content
+        has_blocked = 'blocked' in html_lower or 'forbidden' in html_lower
         
         # Check if we got the right page
-        if 'cardmarket' not in html_content.lower():
+        if 'cardmarket' not in html_lower:
             self._save_debug_html(html_content, url, "not_cardmarket")
-            return FetchResult(listings=[], available_items_total=None, expansion_name=None)
+            return FetchResult(listings=[], available_items_total=None, expansion_name=None), None, None
         
         # Check for blocked/forbidden ONLY if there are no article listings
         # (Words may appear in tooltips/UI even on valid pages)
-        if ('blocked' in html_content.lower() or 'forbidden' in html_content.lower()) and 'article-row' not in html_content:
+        if has_blocked and not has_article_rows:
             self._save_debug_html(html_content, url, "blocked")
-            return FetchResult(listings=[], available_items_total=None, expansion_name=None)
+            return FetchResult(listings=[], available_items_total=None, expansion_name=None), None, None
         
         # Check if we landed on an expansion list instead of a card page
         # More specific check: multi-version pages have "Page 1 of" but NO article-row listings
-        if 'Page 1 of' in html_content and 'Singles/' in url and 'article-row' not in html_content:
+        if 'Page 1 of' in html_content and 'Singles/' in url and not has_article_rows:
             # Extract card name from URL
-            parts = url.split('/')
-            if len(parts) >= 2:
-                card_name_slug = parts[-1].split('?')[0]
+            card_name_slug = _url_slug(url)
+            if card_name_slug:
                 
                 # Try multiple fallback strategies
-                if retry_count == 0:
-                    # First retry: Try with -V-1
-                    if not card_name_slug.endswith('-V-1'):
-                        print(f"   🔄 Multiple versions detected, trying {card_name_slug}-V-1...")
-                        new_url = url.replace(f'/{card_name_slug}?', f'/{card_name_slug}-V-1?')
+                new_url = _next_url_variant(url, retry_count)
+                if new_url:
+                    if retry_count == 0:
+                        _log(f"   🔄 Multiple versions detected, trying {_url_slug(new_url)}...")
                         self._save_debug_html(html_content, url, "multiple_versions_retrying_v1")
-                        return self.fetch_listings(new_url, max_listings, retry_count + 1)
-                elif retry_count == 1:
-                    # Second retry: Try collapsing internal hyphens (e.g., "Ifh-Biff-Efreet" → "IfhBiff-Efreet")
-                    # This handles cases where CardMarket treats hyphenated names as compound words
-                    if '-' in card_name_slug and card_name_slug.count('-') >= 2:
-                        # Remove -V-1 if present for transformation
-                        base_slug = card_name_slug.replace('-V-1', '')
-                        # Split by hyphens and collapse all but the last one
-                        slug_parts = base_slug.split('-')
-                        if len(slug_parts) >= 2:
-                            # Join all parts except last, then add hyphen and last part
-                            collapsed = ''.join(slug_parts[:-1]) + '-' + slug_parts[-1]
-                            print(f"   🔄 Trying without internal hyphens: {collapsed}...")
-                            new_url = url.replace(f'/{card_name_slug}?', f'/{collapsed}?')
-                            self._save_debug_html(html_content, url, "multiple_versions_retrying_collapsed")
-                            return self.fetch_listings(new_url, max_listings, retry_count + 1)
+                    else:
+                        _log(f"   🔄 Trying without internal hyphens: {_url_slug(new_url)}...")
+                        self._save_debug_html(html_content, url, "multiple_versions_retrying_collapsed")
+                    return FetchResult(listings=[], available_items_total=None, expansion_name=None), None, new_url
                 
                 # All retries exhausted
                 self._save_debug_html(html_content, url, "multiple_versions_failed")
-                print("   ❌ Could not determine correct version")
-                return FetchResult(listings=[], available_items_total=None, expansion_name=None)
+                _log("   ❌ Could not determine correct version")
+                return FetchResult(listings=[], available_items_total=None, expansion_name=None), None, None
             else:
                 self._save_debug_html(html_content, url, "multiple_versions")
-                return FetchResult(listings=[], available_items_total=None, expansion_name=None)
+                return FetchResult(listings=[], available_items_total=None, expansion_name=None), None, None
         
         # Store response status before parsing
         response_status = response.status_code if response else None
         
+        soup = None
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, _HTML_PARSER)
             listings = self._parse_listings_table(soup, max_listings)
             available_items = self._extract_available_items(soup)
             expansion_name = self._extract_expansion_name(soup, url)
@@ -359,48 +785,181 @@ class SimpleBrowserScraper:
                 self._save_debug_html(html_content, url, "no_listings_found")
                 
                 # Check what we actually got
-                has_article_rows = 'article-row' in html_content
-                has_blocked = 'blocked' in html_content.lower() or 'forbidden' in html_content.lower()
-                has_cardmarket = 'cardmarket' in html_content.lower()
-                has_no_listings = 'no listings' in html_content.lower() or 'no items' in html_content.lower() or 'currently no' in html_content.lower()
+                has_cardmarket = True  # Pages without it were rejected above
+                has_no_listings = 'no listings' in html_lower or 'no items' in html_lower or 'currently no' in html_lower
                 page_title = soup.find('title')
                 title_text = page_title.get_text(strip=True) if page_title else "No title found"
                 
                 # Check response status
                 status_info = f"HTTP {response_status}" if response_status else "Unknown status"
                 
-                print(f"   ⚠️  No listings found in response ({status_info})")
-                print(f"      Page title: {title_text}")
-                print(f"      Has article-row elements: {has_article_rows}")
-                print(f"      Has 'no listings' message: {has_no_listings}")
-                print(f"      Has blocked/forbidden text: {has_blocked}")
-                print(f"      Contains 'cardmarket': {has_cardmarket}")
-                print(f"      HTML length: {len(html_content)} characters")
+                _log(f"   ⚠️  No listings found in response ({status_info})")
+                _log(f"      Page title: {title_text}")
+                _log(f"      Has article-row elements: {has_article_rows}")
+                _log(f"      Has 'no listings' message: {has_no_listings}")
+                _log(f"      Has blocked/forbidden text: {has_blocked}")
+                _log(f"      Contains 'cardmarket': {has_cardmarket}")
+                _log(f"      HTML length: {len(html_content)} characters")
                 
                 if has_no_listings:
-                    print(f"      💡 This card may have no listings available on Cardmarket")
+                    _log(f"      💡 This card may have no listings available on Cardmarket")
                 elif has_blocked:
-                    print(f"      ⚠️  Page may be blocked - check debug_html/ for details")
+                    _log(f"      ⚠️  Page may be blocked - check debug_html/ for details")
                 else:
-                    print(f"      💡 Check debug_html/ for saved HTML file to diagnose")
+                    _log(f"      💡 Check debug_html/ for saved HTML file to diagnose")
                 
                 # If we got expansion name, still return it
-                return FetchResult(listings=[], available_items_total=available_items, expansion_name=expansion_name)
+                return FetchResult(listings=[], available_items_total=available_items, expansion_name=expansion_name), None, None
             
             # Extract and save card image if enabled
-            if self.save_images:
-                self._extract_and_save_card_image(soup, url)
+            card_image = self._find_card_image(soup, url)
+            if self.save_images and card_image:
+                self._save_card_image(*card_image)
             
             if available_items:
-                print(f"   📊 Total available on Cardmarket: {available_items}")
+                _log(f"   📊 Total available on Cardmarket: {available_items}")
             
-            return FetchResult(listings=listings, available_items_total=available_items, expansion_name=expansion_name)
+            return FetchResult(listings=listings, available_items_total=available_items, expansion_name=expansion_name), card_image, None
             
         except Exception as e:
             # Save HTML when parsing fails
             self._save_debug_html(html_content, url, "parsing_failed", str(e))
-            print(f"   ❌ Parse error: {e}")
-            return FetchResult(listings=[], available_items_total=None, expansion_name=None)
+            _log(f"   ❌ Parse error: {e}")
+            return FetchResult(listings=[], available_items_total=None, expansion_name=None), None, None
+        finally:
+            # Listings are plain dataclasses by now; break the tree's parent/child
+            # cycles so the page is freed immediately instead of at the next GC pass
+            if soup is not None:
+                soup.decompose()
+    
+    def _cache_path(self, url: str, max_listings: int) -> str:
+        """Path of the cache file holding the parsed result for a URL."""
+        key = hashlib.sha1(f"{max_listings}|{url}".encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _load_cached_result(self, url: str,
+                            max_listings: int) -> Optional[Tuple[FetchResult, Optional[Tuple[str, str]]]]:
+        """
+        Return the cached FetchResult and card image for a URL if younger than cache_ttl.
+        
+        Recent results are served from an in-memory LRU; otherwise the disk
+        cache file's mtime is checked before it is read and parsed.
+        """
+        if not self.cache_ttl:
+            return None
+        
+        key = (url, max_listings)
+        now = time.time()
+        with self._memory_cache_lock:
+            entry = self._memory_cache.get(key)
+            if entry:
+                if now - entry[0] < self.cache_ttl:
+                    self._memory_cache.move_to_end(key)
+                    return self._copy_result(entry[1]), entry[2]
+                del self._memory_cache[key]
+        
+        filepath = self._cache_path(url, max_listings)
+        try:
+            if now - os.path.getmtime(filepath) >= self.cache_ttl:
+                return None
+            with open(filepath, 'rb') as f:
+                cached = _loads_json(f.read())
+            if now - cached['ts'] >= self.cache_ttl:
+                return None
+            result = FetchResult(
+                listings=[LiveListing(**d) for d in cached['listings']],
+                available_items_total=cached.get('available_items_total'),
+                expansion_name=cached.get('expansion_name')
+            )
+            card_image = tuple(cached['card_image']) if cached.get('card_image') else None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            _log(f"⚠️  Ignoring unreadable listings cache entry: {e}")
+            return None
+        
+        self._remember_result(key, cached['ts'], result, card_image)
+        return self._copy_result(result), card_image
+    
+    def _remember_result(self, key: tuple, stored_at: float, result: FetchResult,
+                         card_image: Optional[Tuple[str, str]]):
+        """Put a result in the in-memory LRU, evicting the oldest entry when full."""
+        with self._memory_cache_lock:
+            self._memory_cache[key] = (stored_at, result, card_image)
+            self._memory_cache.move_to_end(key)
+            if len(self._memory_cache) > _MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+    
+    @staticmethod
+    def _copy_result(result: FetchResult) -> FetchResult:
+        """Copy of a cached result (list and listings) that callers may modify freely."""
+        return FetchResult(
+            listings=[replace(listing) for listing in result.listings],
+            available_items_total=result.available_items_total,
+            expansion_name=result.expansion_name
+        )
+    
+    def _store_cached_result(self, url: str, max_listings: int, result: FetchResult,
+                             card_image: Optional[Tuple[str, str]] = None):
+        """Cache a successfully parsed FetchResult (and its card image URL) for a URL."""
+        if not self.cache_ttl:
+            return
+        
+        stored_at = time.time()
+        self._remember_result((url, max_listings), stored_at, self._copy_result(result), card_image)
+        
+        filepath = self._cache_path(url, max_listings)
+        tmp_path = f"{filepath}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps_json({
+                    'ts': stored_at,
+                    'url': url,
+                    'listings': [listing.as_dict() for listing in result.listings],
+                    'available_items_total': result.available_items_total,
+                    'expansion_name': result.expansion_name,
+                    'card_image': card_image
+                }))
+            os.replace(tmp_path, filepath)  # Atomic, so concurrent readers never see a partial file
+        except Exception as e:
+            _log(f"⚠️  Could not cache listings: {e}")
+    
+    def fetch_many(self, urls: List[str], max_listings: int = 20, max_workers: int = 4) -> List[FetchResult]:
+        """
+        Fetch live listings for several product pages concurrently.
+        
+        Fetching is dominated by network round trips, so a small fixed pool of
+        workers overlaps them instead of waiting on each page in turn. Each
+        worker still goes through fetch_listings (delays, retries, rate-limit
+        handling included). Page requests stay spaced delay_range apart across
+        all workers, so the pool overlaps round trips, parsing and image
+        downloads but never requests pages faster than a serial loop would.
+        Progress output is buffered per page and printed as one block, headed
+        by the card slug, when that page is done.
+        
+        Args:
+            urls: Cardmarket product URLs
+            max_listings: Maximum number of listings to fetch per URL
+            max_workers: Number of pages fetched at the same time
+            
+        Returns:
+            List of FetchResult, in the same order as urls
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(partial(self._fetch_listings_buffered, max_listings=max_listings), urls))
+    
+    def _fetch_listings_buffered(self, url: str, max_listings: int) -> FetchResult:
+        """fetch_listings for a fetch_many worker, printing the page's output in one block."""
+        _output.buffer = io.StringIO()
+        try:
+            return self.fetch_listings(url, max_listings)
+        finally:
+            text = _output.buffer.getvalue()
+            _output.buffer = None
+            with self._output_lock:
+                sys.stdout.write(f"── {_url_slug(url) or url} ──\n{text}")
+                sys.stdout.flush()
     
     def _extract_available_items(self, soup: BeautifulSoup) -> Optional[int]:
         """Extract 'Available items' count from the product info panel."""
@@ -414,7 +973,7 @@ class SimpleBrowserScraper:
             # Method 2: Look for specific HTML structures
             # Try finding dt/dd pairs or table rows
             for dt in soup.find_all(['dt', 'th', 'label']):
-                if 'available' in dt.get_text().lower() and 'items' in dt.get_text().lower():
+                if _AVAILABLE_ITEMS_LABEL_RE.search(dt.get_text()):
                     # Find the corresponding value
                     dd = dt.find_next(['dd', 'td', 'span'])
                     if dd:
@@ -434,7 +993,7 @@ class SimpleBrowserScraper:
             return None
             
         except Exception as e:
-            print(f"⚠️  Could not extract available items count: {e}")
+            _log(f"⚠️  Could not extract available items count: {e}")
             return None
     
     def _extract_expansion_name(self, soup: BeautifulSoup, url: str) -> Optional[str]:
@@ -451,18 +1010,16 @@ class SimpleBrowserScraper:
         try:
             # Method 1: Extract from URL (most reliable)
             # URL format: /Magic/Products/Singles/{Expansion}/{CardName}
-            if '/Singles/' in url:
-                parts = url.split('/Singles/')
-                if len(parts) > 1:
-                    expansion_slug = parts[1].split('/')[0]
-                    # Convert slug to readable name (e.g., "Revised-Edition" -> "Revised Edition")
-                    expansion_name = expansion_slug.replace('-', ' ').title()
-                    # Handle special cases
-                    expansion_name = expansion_name.replace('V 1', 'V.1')
-                    return expansion_name
+            expansion_slug = _expansion_slug(url)
+            if expansion_slug is not None:
+                # Convert slug to readable name (e.g., "Revised-Edition" -> "Revised Edition")
+                expansion_name = expansion_slug.replace('-', ' ').title()
+                # Handle special cases
+                expansion_name = expansion_name.replace('V 1', 'V.1')
+                return expansion_name
             
             # Method 2: Extract from breadcrumb navigation
-            breadcrumbs = soup.find_all(['a', 'span'], class_=lambda x: x and ('breadcrumb' in x.lower() or 'nav' in x.lower()))
+            breadcrumbs = soup.find_all(['a', 'span'], class_=_BREADCRUMB_CLASS_RE)
             for crumb in breadcrumbs:
                 text = crumb.get_text(strip=True)
                 # Look for expansion links in breadcrumbs
@@ -470,11 +1027,9 @@ class SimpleBrowserScraper:
                     href = crumb.get('href', '')
                     if '/Expansions/' in href or '/Singles/' in href:
                         # Extract from href
-                        if '/Singles/' in href:
-                            parts = href.split('/Singles/')
-                            if len(parts) > 1:
-                                expansion_slug = parts[1].split('/')[0]
-                                return expansion_slug.replace('-', ' ').title()
+                        expansion_slug = _expansion_slug(href)
+                        if expansion_slug is not None:
+                            return expansion_slug.replace('-', ' ').title()
             
             # Method 3: Look for expansion info in product details
             info_sections = soup.select('.product-info, .info-list, [class*="product"]')
@@ -488,7 +1043,7 @@ class SimpleBrowserScraper:
                         return expansion
             
             # Method 4: Look in meta tags or structured data
-            meta_expansion = soup.find('meta', {'property': lambda x: x and 'expansion' in x.lower()})
+            meta_expansion = soup.find('meta', {'property': _EXPANSION_PROPERTY_RE})
             if meta_expansion:
                 content = meta_expansion.get('content', '')
                 if content:
@@ -497,91 +1052,158 @@ class SimpleBrowserScraper:
             return None
             
         except Exception as e:
-            print(f"⚠️  Could not extract expansion name: {e}")
+            _log(f"⚠️  Could not extract expansion name: {e}")
             return None
     
-    def _extract_and_save_card_image(self, soup: BeautifulSoup, url: str) -> Optional[str]:
+    def _find_card_image(self, soup: BeautifulSoup, url: str) -> Optional[Tuple[str, str]]:
         """
-        Extract and save the card image from the page.
+        Find the main card image on the page.
         
         Args:
             soup: BeautifulSoup object of the page
             url: The page URL (for extracting card name)
             
         Returns:
-            Path to saved image or None
+            (image URL, card name) tuple or None
         """
-        import os
+        # Find the main card image (class="is-front" on product page)
+        for img in soup.select('img.is-front'):
+            # Check both src and data-echo attributes
+            img_url = img.get('src') or img.get('data-echo')
+            
+            # Only save product images from CardMarket's S3
+            if img_url and 'product-images.s3.cardmarket.com' in img_url:
+                # Extract card name for filename
+                return img_url, img.get('alt', '') or _url_slug(url)
         
+        return None
+    
+    def _save_card_image(self, img_url: str, card_name: str) -> Optional[str]:
+        """
+        Download a card image unless it is already on disk.
+        
+        Args:
+            img_url: URL of the card image
+            card_name: Card name used for the filename
+            
+        Returns:
+            Path to saved image or None
+        """
         try:
-            # Find the main card image (class="is-front" on product page)
-            main_images = soup.find_all('img', class_='is-front')
+            # Determine file path
+            ext = os.path.splitext(urlsplit(img_url).path)[1].lstrip('.')
+            if ext not in ['jpg', 'jpeg', 'png', 'gif']:
+                ext = 'jpg'
             
-            for img in main_images:
-                # Check both src and data-echo attributes
-                img_url = img.get('src') or img.get('data-echo')
-                alt_text = img.get('alt', '')
-                
-                # Only save product images from CardMarket's S3
-                if img_url and 'product-images.s3.cardmarket.com' in img_url:
-                    # Extract card name for filename
-                    card_name = alt_text if alt_text else url.split('/')[-1].split('?')[0]
-                    # Clean filename: remove illegal chars, replace spaces with underscores
-                    card_name = re.sub(r'[<>:"/\\|?*]', '', card_name)
-                    card_name = card_name.replace(' ', '_').replace(',', '').replace("'", "")
-                    
-                    # Determine file path
-                    ext = img_url.split('.')[-1].split('?')[0]
-                    if ext not in ['jpg', 'jpeg', 'png', 'gif']:
-                        ext = 'jpg'
-                    
-                    filename = f"{card_name}.{ext}"
-                    filepath = os.path.join(self.image_dir, filename)
-                    
-                    # Skip download if image already exists
-                    if os.path.exists(filepath):
-                        return filepath
-                    
-                    # Download the image with appropriate headers
-                    headers = {
-                        'Referer': 'https://www.cardmarket.com/',
-                        'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-                    }
-                    
-                    img_response = self.session.get(img_url, headers=headers, timeout=10)
+            filepath = _image_filepath(card_name, ext, self.image_dir)
+            
+            # Skip download if image already exists
+            if filepath in self._known_images:
+                return filepath
+            if os.path.exists(filepath):
+                self._known_images.add(filepath)
+                return filepath
+            
+            # Download the image with appropriate headers
+            headers = {
+                'Referer': 'https://www.cardmarket.com/',
+                'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
+            }
+            
+            # Stream the image straight to disk instead of buffering it in memory.
+            # Write to a temp file first so a failed download never leaves a
+            # partial image that the exists-check above would then skip.
+            # The temp name is per thread so concurrent fetch_many workers saving
+            # the same card never write into each other's file.
+            tmp_path = f"{filepath}.{threading.get_ident()}.part"
+            try:
+                with self._get(img_url, headers=headers, timeout=10, stream=True) as img_response:
                     img_response.raise_for_status()
-                    
-                    # Save the image
-                    with open(filepath, 'wb') as f:
-                        f.write(img_response.content)
-                    
-                    print(f"   🖼️  Saved image: {filepath}")
-                    return filepath
+                    img_response.raw.decode_content = True
+                    with open(tmp_path, 'wb') as f:
+                        shutil.copyfileobj(img_response.raw, f, length=64 * 1024)
+                os.replace(tmp_path, filepath)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
             
-            return None
+            self._known_images.add(filepath)
+            _log(f"   🖼️  Saved image: {filepath}")
+            return filepath
             
         except Exception as e:
             # Don't fail if image download fails
-            print(f"   ⚠️  Could not save image: {e}")
+            _log(f"   ⚠️  Could not save image: {e}")
             return None
     
+    def _queue_debug_write(self, filepath: str, content: str, mode: str = 'w') -> bool:
+        """
+        Hand a debug file write to the background writer thread.
+        
+        Mode 'log' appends to the long-lived summary log handle instead of
+        opening the file for each line. Debug output is best-effort: when the
+        writer is _DEBUG_QUEUE_SIZE writes behind, the write is dropped.
+        
+        Returns:
+            True if the write was queued, False if it was dropped
+        """
+        with self._debug_writer_lock:
+            if self._debug_writer is None:
+                self._debug_writer = threading.Thread(target=self._debug_writer_loop, daemon=True)
+                self._debug_writer.start()
+                # Flush pending debug files before the interpreter exits
+                atexit.register(self._close_debug_writer)
+        try:
+            self._debug_queue.put_nowait((filepath, content, mode))
+            return True
+        except queue.Full:
+            _log(f"⚠️  Debug writer backlogged, dropped {filepath}")
+            return False
+    
+    def _close_debug_writer(self):
+        """Drain the debug queue and close the summary log."""
+        self._debug_queue.put((None, None, 'close'))
+        self._debug_queue.join()
+    
+    def _debug_writer_loop(self):
+        """Write queued debug files one at a time, off the request path."""
+        while True:
+            try:
+                filepath, content, mode = self._debug_queue.get(timeout=1.0)
+            except queue.Empty:
+                # Idle: push buffered summary lines to disk
+                if self._summary_fh:
+                    self._summary_fh.flush()
+                continue
+            
+            try:
+                if mode == 'close':
+                    if self._summary_fh:
+                        self._summary_fh.close()
+                        self._summary_fh = None
+                elif mode == 'log':
+                    if self._summary_fh is None:
+                        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                        self._summary_fh = open(filepath, 'a', encoding='utf-8', buffering=64 * 1024)
+                    self._summary_fh.write(content)
+                else:
+                    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                    with open(filepath, mode, encoding='utf-8') as f:
+                        f.write(content)
+            except Exception as e:
+                _log(f"⚠️  Could not write debug file {filepath}: {e}")
+            finally:
+                self._debug_queue.task_done()
+    
     def _save_debug_html(self, html_content: str, url: str, status: str, error_msg: str = None):
         """Save HTML content for debugging with organized naming."""
-        import os
         from datetime import datetime
-        from urllib.parse import urlparse
         
-        # Create debug directory if it doesn't exist
         debug_dir = "debug_html"
-        os.makedirs(debug_dir, exist_ok=True)
         
         # Extract card info from URL for filename
-        try:
-            path_parts = urlparse(url).path.split('/')
-            card_info = path_parts[-1] if path_parts[-1] else "unknown_card"
-            card_info = card_info.split('?')[0]  # Remove query params
-        except:
-            card_info = "unknown_card"
+        card_info = _url_slug(url) or "unknown_card"
         
         # Create timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -590,92 +1212,76 @@ class SimpleBrowserScraper:
         filename = f"{timestamp}_{card_info}_{status}.html"
         filepath = os.path.join(debug_dir, filename)
         
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"<!-- DEBUG INFO -->\n")
-                f.write(f"<!-- URL: {url} -->\n")
-                f.write(f"<!-- Status: {status} -->\n")
-                f.write(f"<!-- Timestamp: {timestamp} -->\n")
-                if error_msg:
-                    f.write(f"<!-- Error: {error_msg} -->\n")
-                f.write(f"<!-- HTML Length: {len(html_content)} characters -->\n")
-                f.write(f"<!-- END DEBUG INFO -->\n\n")
-                f.write(html_content)
-            
-            # Silently save debug files (only print on errors)
-            # Also save a summary log
+        header = [
+            "<!-- DEBUG INFO -->",
+            f"<!-- URL: {url} -->",
+            f"<!-- Status: {status} -->",
+            f"<!-- Timestamp: {timestamp} -->",
+        ]
+        if error_msg:
+            header.append(f"<!-- Error: {error_msg} -->")
+        header.append(f"<!-- HTML Length: {len(html_content)} characters -->")
+        header.append("<!-- END DEBUG INFO -->\n\n")
+        
+        # Silently save debug files (write errors are reported by the writer thread)
+        # Also save a summary log
+        if self._queue_debug_write(filepath, '\n'.join(header) + html_content):
             self._log_debug_summary(url, status, error_msg, len(html_content), filepath)
-            
-        except Exception as e:
-            print(f"⚠️  Could not save debug HTML: {e}")
     
     def _save_debug_info(self, url: str, status: str, error_msg: str, response=None):
         """Save debug info when HTML can't be decoded."""
-        import os
         from datetime import datetime
-        from urllib.parse import urlparse
         
         debug_dir = "debug_html"
-        os.makedirs(debug_dir, exist_ok=True)
         
-        try:
-            path_parts = urlparse(url).path.split('/')
-            card_info = path_parts[-1] if path_parts[-1] else "unknown_card"
-            card_info = card_info.split('?')[0]
-        except:
-            card_info = "unknown_card"
+        card_info = _url_slug(url) or "unknown_card"
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{timestamp}_{card_info}_{status}.txt"
         filepath = os.path.join(debug_dir, filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"DEBUG INFO - Failed Request\n")
-                f.write(f"URL: {url}\n")
-                f.write(f"Status: {status}\n")
-                f.write(f"Timestamp: {timestamp}\n")
-                f.write(f"Error: {error_msg}\n")
-                if response:
-                    f.write(f"Response Status: {response.status_code}\n")
-                    f.write(f"Response Headers: {dict(response.headers)}\n")
-                    f.write(f"Response Content Length: {len(response.content)}\n")
-                    f.write(f"Response Content Type: {response.headers.get('content-type', 'unknown')}\n")
-                    f.write(f"Response Encoding: {response.headers.get('content-encoding', 'none')}\n")
-                f.write(f"\n")
-            
-            print(f"💾 Debug info saved: {filepath}")
-            self._log_debug_summary(url, status, error_msg, 0, filepath)
+            lines = [
+                "DEBUG INFO - Failed Request",
+                f"URL: {url}",
+                f"Status: {status}",
+                f"Timestamp: {timestamp}",
+                f"Error: {error_msg}",
+            ]
+            if response:
+                lines.append(f"Response Status: {response.status_code}")
+                lines.append(f"Response Headers: {dict(response.headers)}")
+                lines.append(f"Response Content Length: {len(response.content)}")
+                lines.append(f"Response Content Type: {response.headers.get('content-type', 'unknown')}")
+                lines.append(f"Response Encoding: {response.headers.get('content-encoding', 'none')}")
+            
+            if self._queue_debug_write(filepath, '\n'.join(lines) + '\n\n'):
+                _log(f"💾 Debug info queued for {filepath}")
+                self._log_debug_summary(url, status, error_msg, 0, filepath)
             
         except Exception as e:
-            print(f"⚠️  Could not save debug info: {e}")
+            _log(f"⚠️  Could not save debug info: {e}")
     
     def _log_debug_summary(self, url: str, status: str, error_msg: str, content_length: int, filepath: str):
         """Maintain a summary log of all debug saves."""
-        import os
         from datetime import datetime
         
         debug_dir = "debug_html"
         summary_file = os.path.join(debug_dir, "debug_summary.log")
         
-        try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            with open(summary_file, 'a', encoding='utf-8') as f:
-                f.write(f"[{timestamp}] {status} | {url} | {content_length} chars | {filepath}")
-                if error_msg:
-                    f.write(f" | Error: {error_msg}")
-                f.write(f"\n")
-                
-        except Exception as e:
-            print(f"⚠️  Could not update debug summary: {e}")
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        line = f"[{timestamp}] {status} | {url} | {content_length} chars | {filepath}"
+        if error_msg:
+            line += f" | Error: {error_msg}"
+        
+        self._queue_debug_write(summary_file, line + "\n", mode='log')
     
     def _parse_listings_table(self, soup: BeautifulSoup, max_listings: int) -> List[LiveListing]:
         """Parse the listings from Cardmarket HTML (modern Bootstrap layout)."""
         listings = []
         
         # Look for article rows (this is the modern Cardmarket structure)
-        article_rows = soup.find_all('div', class_=re.compile(r'article-row'))
+        article_rows = soup.select('div.article-row')
         
         if article_rows:
             return self._parse_modern_listings(article_rows, max_listings)
@@ -686,19 +1292,20 @@ class SimpleBrowserScraper:
         for i, table in enumerate(tables):
             # Look for the table that has the most price-like content
             table_text = table.get_text()
-            price_count = len(re.findall(r'€\s*\d+[.,]\d+', table_text))
+            price_count = len(_EURO_PREFIX_PRICE_RE.findall(table_text))
             
             if price_count >= 3:  # Likely a listings table
-                rows = table.find_all('tr')[1:]  # Skip header
+                rows = table.find_all('tr', limit=max_listings + 1)[1:]  # Skip header
+                parse_row = self._parse_listing_row  # Bound once, not per row
                 
-                for j, row in enumerate(rows[:max_listings]):
+                for j, row in enumerate(rows):
                     try:
-                        listing = self._parse_listing_row(row)
+                        listing = parse_row(row)
                         if listing and listing.price > 0:
                             listings.append(listing)
                             # Only print first 3 listings
                             if j < 3:
-                                print(f"      €{listing.price:.2f} - {listing.condition} - {listing.seller}")
+                                _log(f"      €{listing.price:.2f} - {listing.condition} - {listing.seller}")
                     except Exception as e:
                         continue
                 
@@ -707,17 +1314,25 @@ class SimpleBrowserScraper:
                     break
         
         if not listings:
-            # Try to find individual price elements as fallback
-            potential_listings = soup.find_all(['div', 'span', 'td'], 
-                                             text=re.compile(r'€\s*\d+[.,]\d+'))
+            # Try to find individual price elements as fallback, searching the main
+            # content container first (in priority order, not document order) and
+            # stopping after max_listings candidates
+            scope = (soup.select_one('main') or soup.select_one('#mainContent')
+                     or soup.select_one('.tab-content') or soup)
+            potential_listings = scope.find_all(['div', 'span', 'td'],
+                                                string=_EURO_PREFIX_PRICE_RE, limit=max_listings)
+            if not potential_listings and scope is not soup:
+                # The container held no prices; never find less than a full-page search would
+                potential_listings = soup.find_all(['div', 'span', 'td'],
+                                                   string=_EURO_PREFIX_PRICE_RE, limit=max_listings)
             
-            for i, element in enumerate(potential_listings[:max_listings]):
+            for i, element in enumerate(potential_listings):
                 try:
                     element_text = element.get_text(strip=True)
-                    price_match = re.search(r'€\s*(\d+[.,]\d+)', element_text)
+                    price_match = _EURO_PREFIX_PRICE_RE.search(element_text)
                     
                     if price_match:
-                        price_str = price_match.group(1).replace(',', '.')
+                        price_str = price_match.group(1).translate(_COMMA_DOT)
                         price = float(price_str)
                         
                         listing = LiveListing(
@@ -736,15 +1351,16 @@ class SimpleBrowserScraper:
     def _parse_modern_listings(self, article_rows, max_listings: int) -> List[LiveListing]:
         """Parse modern Cardmarket listings from article-row divs."""
         listings = []
+        parse_row = self._parse_modern_listing_row  # Bound once, not per row
         
         for i, row in enumerate(article_rows[:max_listings]):
             try:
-                listing = self._parse_modern_listing_row(row)
+                listing = parse_row(row)
                 if listing and listing.price > 0:
                     listings.append(listing)
                     # Only print first 3 listings
                     if i < 3:
-                        print(f"      €{listing.price:.2f} - {listing.condition} - {listing.seller}")
+                        _log(f"      €{listing.price:.2f} - {listing.condition} - {listing.seller}")
             except Exception as e:
                 continue
         
@@ -759,116 +1375,56 @@ class SimpleBrowserScraper:
             price = 0.0
             
             # First, try to find European format in price spans
-            price_spans = row.find_all('span', class_=re.compile(r'color-primary.*fw-bold'))
+            price_spans = row.select('span.color-primary.fw-bold')
             
             for span in price_spans:
-                span_text = span.get_text(strip=True)
-                
-                # Try European format patterns first
-                european_patterns = [
-                    r'(\d{1,3}(?:\.\d{3})+,\d{2})',  # Multi-thousand format: 1.234,56
-                    r'€\s*(\d{1,3}(?:\.\d{3})+,\d{2})',  # €1.234,56
-                    r'(\d{1,3}(?:\.\d{3})+,\d{2})\s*€',  # 1.234,56 €
-                ]
-                
-                european_matches = []
-                for pattern in european_patterns:
-                    matches = re.findall(pattern, span_text)
-                    for match in matches:
-                        try:
-                            clean_match = match.replace('.', '').replace(',', '.')
-                            value = float(clean_match)
-                            european_matches.append((value, match))
-                        except ValueError:
-                            continue
-                
-                if european_matches:
-                    price, _ = max(european_matches, key=lambda x: x[0])
+                span_price = _parse_price(span.get_text(strip=True))
+                if span_price is not None:
+                    price = span_price
                     break
-                else:
-                    # Fallback to simple pattern for this span
-                    price_match = re.search(r'(\d+[.,]\d+)\s*€', span_text)
-                    if price_match:
-                        price_str = price_match.group(1).replace(',', '.')
-                        price = float(price_str)
-                        break
             
             if price <= 0:
-                # Fallback: search in all text with European format
-                european_patterns = [
-                    r'(\d{1,3}(?:\.\d{3})+,\d{2})',  # Multi-thousand format: 1.234,56
-                    r'€\s*(\d{1,3}(?:\.\d{3})+,\d{2})',  # €1.234,56
-                    r'(\d{1,3}(?:\.\d{3})+,\d{2})\s*€',  # 1.234,56 €
-                ]
-                
-                european_matches = []
-                for pattern in european_patterns:
-                    matches = re.findall(pattern, row_text)
-                    for match in matches:
-                        try:
-                            clean_match = match.replace('.', '').replace(',', '.')
-                            value = float(clean_match)
-                            european_matches.append((value, match))
-                        except ValueError:
-                            continue
-                
-                if european_matches:
-                    price, _ = max(european_matches, key=lambda x: x[0])
-                else:
-                    # Final fallback: simple pattern
-                    price_match = re.search(r'(\d+[.,]\d+)\s*€', row_text)
-                    if price_match:
-                        price_str = price_match.group(1).replace(',', '.')
-                        price = float(price_str)
+                # Fallback: search in all text
+                price = _parse_price(row_text) or 0.0
             
             if price <= 0:
                 return None
             
             # Condition extraction - look for condition badges
             condition = "Unknown"
-            condition_badges = row.find_all('span', class_='badge')
+            condition_badges = row.select('span.badge')
             for badge in condition_badges:
                 badge_text = badge.get_text(strip=True).upper()
-                if badge_text in ['MT', 'NM', 'EX', 'GD', 'LP', 'PL', 'PO']:
+                if badge_text in _CONDITIONS:
                     condition = badge_text
                     break
             
             # Seller extraction - look for user links
             seller = "Unknown"
-            seller_links = row.find_all('a', href=re.compile(r'/Users/'))
-            if seller_links:
-                seller = seller_links[0].get_text(strip=True)
+            seller_link = row.select_one('a[href*="/Users/"]')
+            if seller_link:
+                seller = seller_link.get_text(strip=True)
             
             # Language - look for language icons or text
             language = "Unknown"
-            if 'English' in row_text:
-                language = "English"
-            elif 'German' in row_text:
-                language = "German"
-            elif 'French' in row_text:
-                language = "French"
+            for lang_re, lang_name in _LANGUAGES:
+                if lang_re.search(row_text):
+                    language = lang_name
+                    break
             
             # Quantity - look for item-count
             quantity = 1
-            qty_spans = row.find_all('span', class_='item-count')
-            if qty_spans:
-                qty_text = qty_spans[0].get_text(strip=True)
+            qty_span = row.select_one('span.item-count')
+            if qty_span:
+                qty_text = qty_span.get_text(strip=True)
                 if qty_text.isdigit():
                     quantity = int(qty_text)
             
             # Foil detection
-            foil = 'foil' in row_text.lower()
-            
-            # Country extraction - look for "Item location:" in title attributes
-            seller_country = "Unknown"
-            # CardMarket uses title="Item location: Country" format on icon spans
-            all_spans = row.find_all('span', title=True)
-            for span in all_spans:
-                title = span.get('title', '')
-                if 'Item location:' in title or 'Item location' in title:
-                    # Extract country name after "Item location: "
-                    seller_country = title.replace('Item location:', '').strip()
-                    break
+            foil = _FOIL_RE.search(row_text) is not None
+            
+            # Country extraction - CardMarket uses title="Item location: Country" on icon spans
+            seller_country = _seller_country(row)
             
             return LiveListing(
                 price=price,
@@ -881,115 +1437,87 @@ class SimpleBrowserScraper:
             )
             
         except Exception as e:
-            print(f"⚠️  Error parsing modern listing: {e}")
+            _log(f"⚠️  Error parsing modern listing: {e}")
             return None
     
     def _parse_listing_row(self, row) -> Optional[LiveListing]:
         """Parse a single listing row."""
         try:
-            cells = row.find_all(['td', 'th'])
-            row_text = row.get_text(' ', strip=True)
-            
+            # Two cells are enough to tell a listing row from a spacer/header row
+            cells = row.find_all(['td', 'th'], limit=2)
             if len(cells) < 2:
                 return None
             
+            row_text = row.get_text(' ', strip=True)
+            
             # Price extraction - handle European number format (1.234,56)
             price = 0.0
             
-            # First, try to find the longest/most complete European format price
-            european_patterns = [
-                r'(\d{1,3}(?:\.\d{3})+,\d{2})',  # Multi-thousand format: 1.234,56 or 12.345,67
-                r'€\s*(\d{1,3}(?:\.\d{3})+,\d{2})',  # €1.234,56
-                r'(\d{1,3}(?:\.\d{3})+,\d{2})\s*€',  # 1.234,56 €
-            ]
-            
             # Find all European format matches and pick the highest value (most complete)
             european_matches = []
-            for pattern in european_patterns:
-                matches = re.findall(pattern, row_text)
-                for match in matches:
-                    try:
-                        # Convert European format to float
-                        clean_match = match.replace('.', '').replace(',', '.')
-                        value = float(clean_match)
-                        european_matches.append((value, match))
-                    except ValueError:
-                        continue
+            for match in _THOUSANDS_PRICE_RE.findall(row_text):
+                try:
+                    # Convert European format to float
+                    clean_match = match.translate(_EUROPEAN_DECIMAL)
+                    value = float(clean_match)
+                    european_matches.append((value, match))
+                except ValueError:
+                    continue
             
             if european_matches:
                 # Use the highest value European format match
-                price, price_str = max(european_matches, key=lambda x: x[0])
+                price, price_str = max(european_matches, key=itemgetter(0))
             else:
                 # Fallback to simpler patterns
-                fallback_patterns = [
-                    r'€\s*(\d+,\d{2})',          # €234,56
-                    r'(\d+,\d{2})\s*€',          # 234,56 €
-                    r'€\s*(\d+\.\d{2})',         # €234.56
-                    r'(\d+\.\d{2})\s*€',         # 234.56 €
-                ]
-                
-                for pattern in fallback_patterns:
-                    match = re.search(pattern, row_text)
-                    if match:
-                        price_str = match.group(1)
-                        # Convert to float
-                        if ',' in price_str:
-                            price_str = price_str.replace(',', '.')
-                        try:
-                            price = float(price_str)
-                            break
-                        except ValueError:
-                            continue
+                match = _PRICE_ANY_RE.search(row_text)
+                if not match:
+                    return None
+                price = float((match.group(1) or match.group(2)).translate(_COMMA_DOT))
             
             if price <= 0:
                 return None
             
-            # Condition extraction
+            # Condition extraction (tokens need a lowercased copy; only rows with a price get here)
             condition = "Unknown"
-            condition_keywords = ['mint', 'nm', 'near mint', 'excellent', 'ex', 'good', 'gd', 
-                                'light played', 'lp', 'played', 'pl', 'poor', 'po']
-            
-            for keyword in condition_keywords:
-                if keyword in row_text.lower():
-                    condition = keyword.upper()
+            row_text_lower = row_text.lower()
+            for phrase, label in _CONDITION_PHRASES:
+                if phrase in row_text_lower:
+                    condition = label
                     break
+            else:
+                # Whole-word lookups, so "ex" doesn't match "expensive" or "next"
+                for token in row_text_lower.split():
+                    label = _CONDITION_TOKENS.get(token.strip(_TOKEN_PUNCTUATION))
+                    if label:
+                        condition = label
+                        break
             
             # Seller extraction
             seller = "Unknown"
-            # Look for links that might be seller profiles
-            seller_links = row.find_all('a', href=True)
-            for link in seller_links:
-                href = link.get('href', '')
-                if 'user' in href.lower():
-                    seller = link.get_text(strip=True)
-                    break
+            # First link that might be a seller profile
+            seller_link = row.find('a', href=_USER_RE)
+            if seller_link:
+                seller = seller_link.get_text(strip=True)
             
             # Language extraction
             language = "Unknown"
-            if 'english' in row_text.lower():
-                language = "English"
-            elif 'german' in row_text.lower():
-                language = "German"
+            # Legacy tables only carry English/German; English wins when both appear
+            for lang_re, lang_name in _LANGUAGES[:2]:
+                if lang_re.search(row_text):
+                    language = lang_name
+                    break
             
             # Quantity extraction
             quantity = 1
-            qty_match = re.search(r'(\d+)\s*x', row_text.lower())
+            qty_match = _QTY_RE.search(row_text)
             if qty_match:
                 quantity = int(qty_match.group(1))
             
             # Foil detection
-            foil = 'foil' in row_text.lower()
-            
-            # Country extraction - look for "Item location:" in title attributes
-            seller_country = "Unknown"
-            # CardMarket uses title="Item location: Country" format on icon spans
-            all_spans = row.find_all('span', title=True)
-            for span in all_spans:
-                title = span.get('title', '')
-                if 'Item location:' in title or 'Item location' in title:
-                    # Extract country name after "Item location: "
-                    seller_country = title.replace('Item location:', '').strip()
-                    break
+            foil = _FOIL_RE.search(row_text) is not None
+            
+            # Country extraction - CardMarket uses title="Item location: Country" on icon spans
+            seller_country = _seller_country(row)
             
             return LiveListing(
                 price=price,
@@ -1017,8 +1545,8 @@ def main():
     print(f"🎯 Target: {test_url}")
     print()
     print("💡 This approach uses:")
-    print("   - Perfect Chrome browser headers")
-    print("   - Session cookies from main site first")
+    print("   - Consistent Chromium browser headers (identity rotated per session)")
+    print("   - Landing page visit for fresh session cookies (saved cookies reused)")
     print("   - Adaptive delays (3-5s fast, 9-12s if rate limited)")
     print("   - No proxies - just good headers")
     print()
@@ -1032,42 +1560,48 @@ def main():
         print("=" * 40)
         
         # Sort by price
-        sorted_listings = sorted(listings, key=lambda x: x.price)
+        sorted_listings = sorted(listings, key=attrgetter('price'))
         
+        # Build the table and write it in one go rather than a print per line
+        out = []
         for i, listing in enumerate(sorted_listings, 1):
             foil_indicator = " (Foil)" if listing.foil else ""
-            print(f"{i:2d}. €{listing.price:6.2f} - {listing.condition:12} - {listing.seller}{foil_indicator}")
+            out.append(f"{i:2d}. €{listing.price:6.2f} - {listing.condition:12} - {listing.seller}{foil_indicator}")
             if listing.quantity > 1:
-                print(f"     Quantity: {listing.quantity}")
+                out.append(f"     Quantity: {listing.quantity}")
+        sys.stdout.write('\n'.join(out) + '\n')
         
         # Analysis
-        prices = [l.price for l in listings if l.price > 0]
+        # Prices are already in ascending order, so the extremes are the endpoints
+        prices = [l.price for l in sorted_listings if l.price > 0]
+        cheapest = prices[0] if prices else 0
+        most_expensive = prices[-1] if prices else 0
+        average = math.fsum(prices) / len(prices) if prices else 0
         if prices:
             print(f"\n💰 PRICE ANALYSIS:")
-            print(f"   Cheapest: €{min(prices):.2f}")
-            print(f"   Most expensive: €{max(prices):.2f}")
-            print(f"   Average: €{sum(prices)/len(prices):.2f}")
+            print(f"   Cheapest: €{cheapest:.2f}")
+            print(f"   Most expensive: €{most_expensive:.2f}")
+            print(f"   Average: €{average:.2f}")
         
         # Save results
         output_data = {
             "url": test_url,
             "timestamp": time.time(),
-            "listings": [asdict(listing) for listing in sorted_listings],
+            "listings": [listing.as_dict() for listing in sorted_listings],
             "analysis": {
                 "total_listings": len(listings),
                 "available_items_total": result.available_items_total,
-                "cheapest": min(prices) if prices else 0,
-                "most_expensive": max(prices) if prices else 0,
-                "average": sum(prices)/len(prices) if prices else 0
+                "cheapest": cheapest,
+                "most_expensive": most_expensive,
+                "average": average
             }
         }
         
         output_file = f"data/live_listings_simple_{int(time.time())}.json"
         try:
-            import os
             os.makedirs('data', exist_ok=True)
-            with open(output_file, 'w') as f:
-                json.dump(output_data, f, indent=2)
+            with open(output_file, 'wb') as f:
+                f.write(_dumps_json(output_data, indent=True))
             print(f"\n💾 Results saved to: {output_file}")
         except Exception as e:
             print(f"⚠️  Could not save results: {e}")
@@ -2,85 +2,138 @@
 import asyncio
 import websockets
 import json
+import ssl
 import sys
-import time
 
-async def test_lobby_chat():
-    # Use the ngrok URL from the logs
-    uri = "wss://3f9e6f265dd2.ngrok.app/ws/lobby"
-    
-    print(f"Connecting to {uri}...")
-    
-    import ssl
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
+try:
+    import uvloop  # Optional: faster event loop for many concurrent sockets
+except ImportError:
+    uvloop = None
+
+# Outgoing frames never change, so serialize them once up front (compact
+# separators keep the frames minimal). They stay str (not bytes) because the
+# server reads TEXT frames via receive_json().
+JSON_SEPARATORS = (",", ":")
+PONG_MESSAGE = json.dumps({"type": "pong"}, separators=JSON_SEPARATORS)
+# Starlette's send_json() emits compact JSON, so the server's keepalive ping
+# arrives as exactly this text and can be answered without parsing it.
+PING_MESSAGE = json.dumps({"type": "ping"}, separators=JSON_SEPARATORS)
+CHAT_MESSAGE = json.dumps({
+    "action": "lobby_chat",
+    "data": {
+        "message": "Test message from script",
+        "playerName": "TestUser"
+    }
+}, separators=JSON_SEPARATORS)
+
+# Built once: create_default_context() loads the system CA store, which is
+# wasted work to repeat for every connection.
+SSL_CONTEXT = ssl.create_default_context()
+SSL_CONTEXT.check_hostname = False
+SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+SSL_CONTEXT.options &= ~ssl.OP_NO_TICKET  # Session tickets (default, made explicit)
+
+# Use the ngrok URL from the logs
+LOBBY_URI = "wss://3f9e6f265dd2.ngrok.app/ws/lobby"
+
+async def run_lobby_client(uri: str, label: str = ""):
+    """Connect one lobby client, send a chat message and listen for 10 seconds."""
+    print(f"{label}Connecting to {uri}...")
     
     try:
-        async with websockets.connect(uri, ssl=ssl_context) as websocket:
-            print("✅ Connected! Waiting for initial message...")
+        # compression=None: chat frames are tiny, so permessage-deflate only
+        # adds an inflate pass over every frame before it can be decoded.
+        async with websockets.connect(uri, ssl=SSL_CONTEXT, compression=None) as websocket:
+            print(f"{label}✅ Connected! Waiting for initial message...")
             
             # Wait for initial chat history
             try:
-                initial_msg = await asyncio.wait_for(websocket.recv(), timeout=5.0)
+                async with asyncio.timeout(5.0):
+                    initial_msg = await websocket.recv()
                 initial_data = json.loads(initial_msg)
-                print(f"\n📨 Received initial message:")
-                print(f"   Type: {initial_data.get('type')}")
-                if initial_data.get('type') == 'lobby_chat_history':
+                print(f"\n{label}📨 Received initial message:")
+                initial_type = initial_data.get('type')
+                print(f"{label}   Type: {initial_type}")
+                if initial_type == 'lobby_chat_history':
                     messages = initial_data.get('messages', [])
-                    print(f"   Messages: {len(messages)}")
+                    print(f"{label}   Messages: {len(messages)}")
                     if len(messages) > 0:
-                        print(f"   Last message: {messages[-1]}")
-            except asyncio.TimeoutError:
-                print("⚠️ No initial message received within 5 seconds")
+                        print(f"{label}   Last message: {messages[-1]}")
+            except TimeoutError:
+                print(f"{label}⚠️ No initial message received within 5 seconds")
             
             # Send a test chat message
-            print(f"\n📤 Sending test chat message...")
-            chat_action = {
-                "action": "lobby_chat",
-                "data": {
-                    "message": "Test message from script",
-                    "playerName": "TestUser"
-                }
-            }
-            await websocket.send(json.dumps(chat_action))
-            print("✅ Message sent")
+            print(f"\n{label}📤 Sending test chat message...")
+            await websocket.send(CHAT_MESSAGE)
+            print(f"{label}✅ Message sent")
             
             # Wait for responses (including ping messages)
-            print("Waiting for responses (will listen for 10 seconds)...")
+            print(f"{label}Waiting for responses (will listen for 10 seconds)...")
+            # Only receive (and answer pings) inside the loop; everything
+            # is printed once the listen window has closed.
             responses = []
-            start_time = time.time()
+            responses_append = responses.append
+            idle_timeouts = 0
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
+            deadline = start_time + 10.0
             try:
-                while time.time() - start_time < 10:
+                while (remaining := deadline - loop.time()) > 0:
                     try:
-                        msg = await asyncio.wait_for(websocket.recv(), timeout=2.0)
+                        async with asyncio.timeout(min(2.0, remaining)):
+                            msg = await websocket.recv()
+                        if msg == PING_MESSAGE:
+                            await websocket.send(PONG_MESSAGE)
+                            responses_append((loop.time() - start_time, 'ping', None))
+                            continue
                         data = json.loads(msg)
-                        responses.append(data)
-                        print(f"\n📨 Response received:")
-                        print(f"   Type: {data.get('type')}")
-                        if data.get('type') == 'lobby_chat_message':
-                            print(f"   Player: {data.get('playerName')}")
-                            print(f"   Message: {data.get('message')}")
-                        elif data.get('type') == 'ping':
-                            print(f"   Ping received - sending pong")
-                            await websocket.send(json.dumps({"type": "pong"}))
-                    except asyncio.TimeoutError:
-                        print(".", end="", flush=True)
+                        msg_type = data.get('type')
+                        responses_append((loop.time() - start_time, msg_type, data))
+                        if msg_type == 'ping':
+                            await websocket.send(PONG_MESSAGE)
+                    except TimeoutError:
+                        idle_timeouts += 1
                         continue
             except KeyboardInterrupt:
-                print("\nInterrupted")
+                print(f"\n{label}Interrupted")
+            
+            for received_at, msg_type, data in responses:
+                print(f"\n{label}📨 Response received (+{received_at:.1f}s):")
+                print(f"{label}   Type: {msg_type}")
+                if msg_type == 'lobby_chat_message':
+                    print(f"{label}   Player: {data.get('playerName')}")
+                    print(f"{label}   Message: {data.get('message')}")
+                elif msg_type == 'ping':
+                    print(f"{label}   Ping received - sent pong")
             
-            print(f"\n✅ Test complete. Received {len(responses)} responses.")
-            print(f"   Connection stayed alive for {time.time() - start_time:.1f} seconds")
+            print(f"\n{label}✅ Test complete. Received {len(responses)} responses.")
+            print(f"{label}   Connection stayed alive for {loop.time() - start_time:.1f} seconds")
+            print(f"{label}   Idle recv timeouts: {idle_timeouts}")
             
     except websockets.exceptions.InvalidStatusCode as e:
-        print(f"❌ Connection failed with status {e.status_code}")
-        print(f"   Headers: {e.headers}")
+        print(f"{label}❌ Connection failed with status {e.status_code}")
+        print(f"{label}   Headers: {e.headers}")
     except Exception as e:
-        print(f"❌ Error: {e}")
+        print(f"{label}❌ Error: {e}")
         import traceback
         traceback.print_exc()
 
+async def test_lobby_chat(num_clients: int = 1):
+    """Run ``num_clients`` lobby clients concurrently against the server."""
+    if num_clients == 1:
+        await run_lobby_client(LOBBY_URI)
+        return
+    
+    print(f"Starting {num_clients} concurrent lobby clients...")
+    async with asyncio.TaskGroup() as tg:
+        for i in range(num_clients):
+            tg.create_task(run_lobby_client(LOBBY_URI, label=f"[client {i}] "))
+
 if __name__ == "__main__":
-    asyncio.run(test_lobby_chat())
+    num_clients = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    # asyncio.Runner takes a loop factory on 3.11+, so this works with any uvloop
+    # version (uvloop.run only exists from 0.18)
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(test_lobby_chat(num_clients))
 